@@ -1,16 +1,85 @@
 from typing import Dict
 
-from tornado import httpclient
+from tornado import httpclient, ioloop
 
 from utilities import integration_adaptors_logger as log
+import functools
 import logging
 import ssl
 
+try:
+    import pycurl
+except ImportError:
+    pycurl = None
+
 logger = log.IntegrationAdaptorsLogger(__name__)
 
+# Resolved once at import time, as ssl.get_default_verify_paths hits the filesystem on every call.
+_DEFAULT_CAFILE = ssl.get_default_verify_paths().cafile
+
+# Request/response bodies can be tens of KB, so only this many characters are logged at debug level.
+_MAX_LOG_BODY = 512
+
+
+class _LazyResponseBody(object):
+    """Defers decoding a response body until it is actually rendered into a log message."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def __str__(self) -> str:
+        return self._body[:_MAX_LOG_BODY].decode('utf-8', 'replace') if self._body else ''
+
+
+@functools.lru_cache(maxsize=1)
+def _warn_certificate_validation_disabled() -> None:
+    """Warn that certificate validation is off, once per process rather than once per request."""
+    logger.warning("Server certificate validation has been disabled.")
+
+
+def _tune_curl(curl) -> None:
+    """Tune a curl easy handle before it is used for a fetch.
+
+    Enables the TLS session ID cache and connection reuse so that repeated requests to the same host (e.g. Spine)
+    use abbreviated TLS handshakes and warm TCP connections rather than paying the full handshake cost every time.
+    """
+    curl.setopt(pycurl.SSL_SESSIONID_CACHE, 1)
+    curl.setopt(pycurl.FORBID_REUSE, 0)
+    curl.setopt(pycurl.FRESH_CONNECT, 0)
+
+    # Offer HTTP/2 over TLS where both libcurl and the remote endpoint support it, falling back to HTTP/1.1
+    # via ALPN otherwise.
+    http2_over_tls = getattr(pycurl, 'CURL_HTTP_VERSION_2TLS', None)
+    if http2_over_tls is not None:
+        try:
+            curl.setopt(pycurl.HTTP_VERSION, http2_over_tls)
+        except pycurl.error:
+            pass
+
+    # Prefer waiting for an existing connection to become available for multiplexing over opening a new one.
+    # Only affects HTTP/2-capable connections; HTTP/1.1 traffic is unchanged.
+    pipewait = getattr(pycurl, 'PIPEWAIT', None)
+    if pipewait is not None:
+        curl.setopt(pipewait, 1)
+
 
 class CommonHttps(object):
 
+    _client: httpclient.AsyncHTTPClient = None
+
+    @staticmethod
+    def _get_client() -> httpclient.AsyncHTTPClient:
+        """Return the shared HTTP client used for all requests.
+
+        The client is created lazily on first use and then reused, so that the underlying implementation (e.g. the
+        curl client configured at application startup) can keep TCP connections and TLS sessions warm across
+        requests instead of paying the full handshake cost each time. A fresh client is created if the current
+        IOLoop has changed, as clients are bound to the loop they were created on.
+        """
+        if CommonHttps._client is None or CommonHttps._client.io_loop is not ioloop.IOLoop.current():
+            CommonHttps._client = httpclient.AsyncHTTPClient()
+        return CommonHttps._client
+
     @staticmethod
     async def make_request(url: str, method: str, headers: Dict[str, str], body: str, client_cert: str = None,
                            client_key: str = None, ca_certs: str = None, validate_cert: bool = True,
@@ -39,28 +108,29 @@ class CommonHttps(object):
                     })
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Request {headers}", fparams={"headers": headers})
-            logger.debug("Request {body}", fparams={"body": body})
+            logger.debug("Request {body}", fparams={"body": body[:_MAX_LOG_BODY] if body else body})
 
         if not validate_cert:
-            logger.warning("Server certificate validation has been disabled.")
+            _warn_certificate_validation_disabled()
 
         if ca_certs is None:
-            ca_certs = ssl.get_default_verify_paths().cafile
-
-        response = await httpclient.AsyncHTTPClient().fetch(url,
-                                                            raise_error=raise_error_response,
-                                                            method=method,
-                                                            body=body,
-                                                            headers=headers,
-                                                            client_cert=client_cert,
-                                                            client_key=client_key,
-                                                            ca_certs=ca_certs,
-                                                            validate_cert=validate_cert,
-                                                            proxy_host=http_proxy_host,
-                                                            proxy_port=http_proxy_port)
+            ca_certs = _DEFAULT_CAFILE
+
+        response = await CommonHttps._get_client().fetch(url,
+                                                         raise_error=raise_error_response,
+                                                         method=method,
+                                                         body=body,
+                                                         headers=headers,
+                                                         client_cert=client_cert,
+                                                         client_key=client_key,
+                                                         ca_certs=ca_certs,
+                                                         validate_cert=validate_cert,
+                                                         proxy_host=http_proxy_host,
+                                                         proxy_port=http_proxy_port,
+                                                         prepare_curl_callback=_tune_curl if pycurl else None)
 
         logger.info("Response {code}", fparams={"code": response.code})
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Response {body}", fparams={"body": response.body.decode() if response.body else ''})
+            logger.debug("Response {body}", fparams={"body": _LazyResponseBody(response.body)})
 
         return response
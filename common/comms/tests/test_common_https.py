@@ -41,7 +41,8 @@ class TestCommonHttps(IsolatedAsyncioTestCase):
                                           ca_certs=CA_CERTS,
                                           validate_cert=False,
                                           proxy_host=HTTP_PROXY_HOST,
-                                          proxy_port=HTTP_PROXY_PORT)
+                                          proxy_port=HTTP_PROXY_PORT,
+                                          prepare_curl_callback=ANY)
 
             self.assertIs(actual_response, return_value, "Expected content should be returned.")
 
@@ -62,16 +63,15 @@ class TestCommonHttps(IsolatedAsyncioTestCase):
                                           ca_certs=ANY,
                                           validate_cert=True,
                                           proxy_host=None,
-                                          proxy_port=None)
+                                          proxy_port=None,
+                                          prepare_curl_callback=ANY)
 
             self.assertIs(actual_response, return_value, "Expected content should be returned.")
 
     async def test_make_request_with_no_cacert_uses_ssl_default_verify_path_cafile(self):
-        import ssl
+        from comms import common_https
         with patch.object(httpclient.AsyncHTTPClient(), "fetch") as mock_fetch, \
-            patch.object(ssl, 'get_default_verify_paths', return_value=ssl.DefaultVerifyPaths(
-                CA_CERTS, None, None, None, None, None
-            )):
+                patch.object(common_https, '_DEFAULT_CAFILE', CA_CERTS):
             return_value = Mock()
             mock_fetch.return_value = awaitable(return_value)
 
@@ -91,6 +91,7 @@ class TestCommonHttps(IsolatedAsyncioTestCase):
                                           ca_certs=CA_CERTS,
                                           validate_cert=False,
                                           proxy_host=HTTP_PROXY_HOST,
-                                          proxy_port=HTTP_PROXY_PORT)
+                                          proxy_port=HTTP_PROXY_PORT,
+                                          prepare_curl_callback=ANY)
 
             self.assertIs(actual_response, return_value, "Expected content should be returned.")
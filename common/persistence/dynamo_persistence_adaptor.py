@@ -15,6 +15,10 @@ logger = log.IntegrationAdaptorsLogger(__name__)
 
 _KEY = "key"
 
+# A single boto session shared by all adaptor instances (e.g. the work description and sync-async stores), so that
+# they draw credentials and connections from one pool instead of maintaining one per store.
+_boto_session = aioboto3.Session()
+
 
 class DynamoPersistenceAdaptor(persistence_adaptor.PersistenceAdaptor):
     """Class responsible for persisting items into a DynamoDB."""
@@ -33,7 +37,7 @@ class DynamoPersistenceAdaptor(persistence_adaptor.PersistenceAdaptor):
         self.retry_delay = retry_delay
         self.max_retries = max_retries
 
-        self.boto_session = aioboto3.Session()
+        self.boto_session = _boto_session
         self.endpoint_url = config.get_config('DB_ENDPOINT_URL', None)
         self.region_name = config.get_config('CLOUD_REGION', 'eu-west-2')
 
@@ -18,6 +18,9 @@ _DB_NAME = 'integration-adaptors'
 _KEY = "_id"
 _CERT_FILE_PATH = "/db-cert.pem"
 
+# The Mongo client shared by all adaptor instances. Created lazily as building it requires config to be set up.
+_client = None
+
 
 class MongoPersistenceAdaptor(persistence_adaptor.PersistenceAdaptor):
     """Class responsible for persisting items into a MongoDB."""
@@ -36,10 +39,22 @@ class MongoPersistenceAdaptor(persistence_adaptor.PersistenceAdaptor):
         self.retry_delay = retry_delay
         self.max_retries = max_retries
 
-        client = self._build_client()
-        
+        client = self._get_client()
+
         self.collection = client[_DB_NAME][table_name]
 
+    @classmethod
+    def _get_client(cls):
+        """Return the Mongo client shared by all adaptor instances, creating it on first use.
+
+        Sharing one client lets the stores (e.g. work description and sync-async) draw from a single
+        connection pool rather than maintaining one per store.
+        """
+        global _client
+        if _client is None:
+            _client = cls._build_client()
+        return _client
+
     @staticmethod
     def _build_client():
         cert = os.environ.get('MHS_DB_CA_CERTS', None)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from typing import Callable, Awaitable
 
 import utilities.integration_adaptors_logger as log
@@ -21,6 +22,7 @@ class RetriableAction(object):
         self.action = action
         self.retries = retries
         self.delay = delay
+        self.max_delay = None
         self.retriable_exception_check = lambda exception: True
         self.success_check = lambda result: True
 
@@ -42,6 +44,20 @@ class RetriableAction(object):
         self.success_check = success_check
         return self
 
+    def with_exponential_backoff(self, max_delay: float) -> RetriableAction:
+        """Use exponential backoff with full jitter between retries, rather than a flat delay.
+
+        The delay before retry attempt n is drawn uniformly from [0, min(max_delay, delay * 2 ** (n - 1))], so
+        retries back off progressively without becoming synchronised across callers.
+
+        :param max_delay: The upper bound (in seconds) on the delay between retries.
+        :return self
+        """
+        logger.info("Setting retriable action's backoff to exponential with {max_delay}",
+                    fparams={"max_delay": max_delay})
+        self.max_delay = max_delay
+        return self
+
     def with_retriable_exception_check(self, exception_check: Callable[[Exception], bool]) -> RetriableAction:
         """Set a callable that can be used to determine whether an exception raised by the action will prompt a retry.
 
@@ -64,9 +80,10 @@ class RetriableAction(object):
 
         if self._retry_required(result):
             for i in range(self.retries):
+                delay = self._delay_before_retry(i + 1)
                 logger.info("Sleeping for {delay} seconds before retrying {action}.",
-                            fparams={"delay": self.delay, "action": self.action})
-                await asyncio.sleep(self.delay)
+                            fparams={"delay": delay, "action": self.action})
+                await asyncio.sleep(delay)
 
                 result = await self._execute_action(*args, **kwargs)
 
@@ -111,6 +128,11 @@ class RetriableAction(object):
         logger.info("{retry_required} for {action}", fparams={"retry_required": retry_required, "action": self.action})
         return retry_required
 
+    def _delay_before_retry(self, attempt: int) -> float:
+        if self.max_delay is None:
+            return self.delay
+        return random.uniform(0, min(self.max_delay, self.delay * (2 ** (attempt - 1))))
+
     def _exception_is_retriable(self, exception: Exception) -> bool:
         return self.retriable_exception_check(exception)
 
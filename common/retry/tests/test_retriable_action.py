@@ -118,6 +118,23 @@ class TestRetriableAction(unittest.IsolatedAsyncioTestCase):
                          f"When action is executed {DEFAULT_RETRIES + 1} times, sleep should only be called "
                          f"{DEFAULT_RETRIES} times")
 
+    @mock.patch("asyncio.sleep")
+    async def test_exponential_backoff_delays_are_jittered_and_bounded(self, mock_sleep):
+        max_delay = 0.3
+        self.mock_action.side_effect = Exception
+        mock_sleep.return_value = test_utilities.awaitable(None)
+
+        await retriable_action.RetriableAction(self.mock_action, retries=DEFAULT_RETRIES, delay=DEFAULT_DELAY) \
+            .with_exponential_backoff(max_delay) \
+            .execute()
+
+        self.assertEqual(DEFAULT_RETRIES, mock_sleep.call_count)
+        for attempt, sleep_call in enumerate(mock_sleep.call_args_list, start=1):
+            delay_used = sleep_call[0][0]
+            self.assertGreaterEqual(delay_used, 0, "Backoff delay should never be negative.")
+            self.assertLessEqual(delay_used, min(max_delay, DEFAULT_DELAY * (2 ** (attempt - 1))),
+                                 "Backoff delay should be bounded by the exponential schedule and max_delay.")
+
     @mock.patch("asyncio.sleep")
     async def test_should_not_sleep_if_no_retries(self, mock_sleep):
         self.mock_action.side_effect = Exception
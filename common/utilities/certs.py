@@ -38,17 +38,29 @@ class Certs(object):
         created_certs = Certs()
         if private_key:
             private_key_file = certs_dir / "client.key"
-            private_key_file.write_text(private_key)
+            Certs._write_file_if_changed(private_key_file, private_key)
+            private_key_file.chmod(0o600)
             created_certs.private_key_path = str(private_key_file)
 
         if local_cert:
             local_cert_file = certs_dir / "client.pem"
-            local_cert_file.write_text(local_cert)
+            Certs._write_file_if_changed(local_cert_file, local_cert)
             created_certs.local_cert_path = str(local_cert_file)
 
         if ca_certs:
             ca_certs_file = certs_dir / "ca_certs.pem"
-            ca_certs_file.write_text(ca_certs)
+            Certs._write_file_if_changed(ca_certs_file, ca_certs)
             created_certs.ca_certs_path = str(ca_certs_file)
 
         return created_certs
+
+    @staticmethod
+    def _write_file_if_changed(file: pathlib.Path, contents: str) -> None:
+        """Write contents to file, skipping the write if the file already holds the same contents.
+
+        :param file: The file to write to.
+        :param contents: The contents to write.
+        """
+        if file.is_file() and file.read_text() == contents:
+            return
+        file.write_text(contents)
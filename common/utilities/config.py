@@ -9,6 +9,8 @@ import logging
 import os
 from typing import Dict, Optional
 
+from utilities.string_utilities import str2bool
+
 config: Dict[str, str] = {}
 
 
@@ -47,3 +49,16 @@ def get_config(key: str, default: Optional[str] = _config_default) -> str:
     else:
         logging.error(f'Failed to get config ConfigName="{key}"')
         raise KeyError
+
+
+def get_config_bool(key: str, default: Optional[bool] = _config_default) -> Optional[bool]:
+    """
+    Get a boolean config variable or error out (and log the error)
+
+    :param key: key to lookup
+    :param default: default value to return if none is found. As with `get_config`, a default (including `None`) is
+    returned as-is rather than parsed.
+    :return: the config variable parsed as a boolean
+    """
+    value = get_config(key) if default is _config_default else get_config(key, default=default)
+    return str2bool(value) if isinstance(value, str) else value
@@ -35,6 +35,8 @@ class IntegrationAdaptorsLogger(logging.LoggerAdapter):
         super().__init__(logging.getLogger(name), extra=None)
 
     def log(self, level: int, msg: Any, *args: Any, **kwargs: Any) -> None:
+        if not self.isEnabledFor(level):
+            return
         msg = self._format_using_custom_params(msg, kwargs)
         super().log(level, msg, *args, **kwargs)
 
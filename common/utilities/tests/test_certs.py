@@ -21,6 +21,13 @@ class TestCerts(unittest.TestCase):
             self.assertEqual(str(expected_private_key_filepath), returned_certs.private_key_path)
             self.assertTrue(expected_private_key_filepath.read_text(), _TEST_FILE_CONTENTS)
 
+    def test_create_certs_files_restricts_private_key_permissions(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            returned_certs = certs.Certs.create_certs_files(temp_dir, private_key=_TEST_FILE_CONTENTS)
+
+            private_key_mode = pathlib.Path(returned_certs.private_key_path).stat().st_mode & 0o777
+            self.assertEqual(0o600, private_key_mode)
+
     def test_create_certs_files_creates_local_cert(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             returned_certs = certs.Certs.create_certs_files(temp_dir, local_cert=_TEST_FILE_CONTENTS)
@@ -37,6 +44,26 @@ class TestCerts(unittest.TestCase):
             self.assertEqual(str(expected_ca_certs_filepath), returned_certs.ca_certs_path)
             self.assertTrue(expected_ca_certs_filepath.read_text(), _TEST_FILE_CONTENTS)
 
+    def test_create_certs_files_skips_rewrite_when_content_unchanged(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            returned_certs = certs.Certs.create_certs_files(temp_dir, local_cert=_TEST_FILE_CONTENTS)
+
+            local_cert_file = pathlib.Path(returned_certs.local_cert_path)
+            mtime_before = local_cert_file.stat().st_mtime_ns
+
+            certs.Certs.create_certs_files(temp_dir, local_cert=_TEST_FILE_CONTENTS)
+
+            self.assertEqual(mtime_before, local_cert_file.stat().st_mtime_ns, msg='file was rewritten unnecessarily')
+            self.assertEqual(_TEST_FILE_CONTENTS, local_cert_file.read_text())
+
+    def test_create_certs_files_rewrites_when_content_changed(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            certs.Certs.create_certs_files(temp_dir, local_cert='old-contents')
+
+            returned_certs = certs.Certs.create_certs_files(temp_dir, local_cert=_TEST_FILE_CONTENTS)
+
+            self.assertEqual(_TEST_FILE_CONTENTS, pathlib.Path(returned_certs.local_cert_path).read_text())
+
     def test_create_certs_files_creates_multiple_file(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             test_file_contents_1 = 'test-file-contents1'
@@ -46,6 +46,27 @@ class TestConfig(unittest.TestCase):
     def test_get_config_default_none(self, unused):
         self.assertIsNone(config.get_config("LOG_LEVEL", default=None))
 
+    def test_get_config_bool_success(self, mock_environ):
+        mock_environ["PREFIX_TEST"] = "True"
+
+        config.setup_config("PREFIX")
+
+        self.assertIs(True, config.get_config_bool("TEST"))
+
+    def test_get_config_bool_default(self, unused):
+        self.assertIs(False, config.get_config_bool("TEST", default=False))
+
+    def test_get_config_bool_default_of_none(self, unused):
+        self.assertIsNone(config.get_config_bool("TEST", default=None))
+
+    def test_get_config_bool_invalid_value(self, mock_environ):
+        mock_environ["PREFIX_TEST"] = "not-a-bool"
+
+        config.setup_config("PREFIX")
+
+        with self.assertRaises(ValueError):
+            config.get_config_bool("TEST")
+
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_get_config_no_config_variable_found(self, mock_stdout, mock_environ):
         mock_environ["PREFIX_LOG_LEVEL"] = "INFO"
@@ -1,6 +1,4 @@
 """This module defines the configuration manager component."""
-import copy
-
 import utilities.file_utilities as file_utilities
 
 
@@ -17,7 +15,11 @@ class ConfigurationManager(object):
     def get_interaction_details(self, interaction_name: str) -> dict:
         """Get details for the specified interaction.
 
+        Each call returns a fresh copy of the interaction's (flat) details dictionary, so callers are free to add
+        request-specific entries to it without affecting later lookups.
+
         :param interaction_name: The name of the interaction to retrieve details for.
         :return: A dictionary of interaction-specific details, or None if an entry for the specified name was not found.
         """
-        return copy.deepcopy(self.interactions.get(interaction_name))
+        interaction_details = self.interactions.get(interaction_name)
+        return dict(interaction_details) if interaction_details is not None else None
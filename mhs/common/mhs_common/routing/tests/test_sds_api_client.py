@@ -142,7 +142,7 @@ class TestSdsApiClient(unittest.IsolatedAsyncioTestCase):
                       headers={'X-Correlation-ID': CORRELATION_ID, 'apikey': API_KEY},
                       client_cert=None, client_key=None,
                       ca_certs=ANY, validate_cert=True, proxy_host=None,
-                      proxy_port=None)
+                      proxy_port=None, prepare_curl_callback=ANY)
                  for expected_url in expected_urls]
 
         self.mock_http_client.fetch.assert_has_calls(calls)
@@ -148,7 +148,7 @@ class TestSpineRouteLookupClient(unittest.IsolatedAsyncioTestCase):
                                                        method=HTTP_METHOD, body=None, headers=None,
                                                        client_cert=client_cert, client_key=client_key,
                                                        ca_certs=ca_certs, validate_cert=True, proxy_host=proxy_host,
-                                                       proxy_port=proxy_port)
+                                                       proxy_port=proxy_port, prepare_curl_callback=ANY)
 
     @staticmethod
     def _build_url(path: str, org_code: str = ORG_CODE) -> str:
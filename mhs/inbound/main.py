@@ -17,7 +17,6 @@ from persistence.persistence_adaptor_factory import get_persistence_adaptor
 from utilities import secrets, certs
 
 import inbound.request.handler as async_request_handler
-from utilities.string_utilities import str2bool
 
 logger = log.IntegrationAdaptorsLogger(__name__)
 
@@ -64,7 +63,7 @@ def start_inbound_server(local_certs_file: str, ca_certs_file: str, key_file: st
                                                              config_manager=config_manager))])
 
     ssl_ctx = build_ssl_context(local_certs_file, ca_certs_file, key_file) \
-        if str2bool(config.get_config('INBOUND_USE_SSL', default=str(True))) \
+        if config.get_config_bool('INBOUND_USE_SSL', default=True) \
         else None
 
     inbound_server = tornado.httpserver.HTTPServer(inbound_application, ssl_options=ssl_ctx)
@@ -1,3 +1,4 @@
+import asyncio
 import pathlib
 import ssl
 from typing import Dict
@@ -20,16 +21,30 @@ from mhs_common.workflow import sync_async_resynchroniser as resync
 from outbound.transmission import outbound_transmission
 from utilities import config, certs
 from utilities import secrets
-from utilities.string_utilities import str2bool
 
 logger = log.IntegrationAdaptorsLogger(__name__)
 
 
+def configure_event_loop():
+    """
+    Install the uvloop event loop if it is available. uvloop is an optional dependency - when it is not installed
+    the stock asyncio event loop is used instead.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info('Using uvloop event loop')
+
+
 def configure_http_client():
     """
-    Configure Tornado to use the curl HTTP client.
+    Configure Tornado to use the curl HTTP client, sized for the expected number of concurrent outbound requests.
     """
-    tornado.httpclient.AsyncHTTPClient.configure('tornado.curl_httpclient.CurlAsyncHTTPClient')
+    max_clients = int(config.get_config('OUTBOUND_HTTP_MAX_CLIENTS', default='100'))
+    tornado.httpclient.AsyncHTTPClient.configure('tornado.curl_httpclient.CurlAsyncHTTPClient',
+                                                 max_clients=max_clients)
 
 
 def initialise_workflows(transmission: outbound_transmission.OutboundTransmission, party_key: str,
@@ -70,7 +85,7 @@ def initialise_spine_route_lookup():
 
     spine_route_lookup_url = config.get_config('SPINE_ROUTE_LOOKUP_URL')
     spine_org_code = config.get_config('SPINE_ORG_CODE')
-    validate_cert = str2bool(config.get_config('SPINE_ROUTE_LOOKUP_VALIDATE_CERT', default=str(True)))
+    validate_cert = config.get_config_bool('SPINE_ROUTE_LOOKUP_VALIDATE_CERT', default=True)
 
     route_data_dir = pathlib.Path(definitions.ROOT_DIR) / "route"
     certificates = certs.Certs.create_certs_files(route_data_dir,
@@ -108,15 +123,23 @@ def initialise_sds_api_client():
     return sds_api_client.SdsApiClient(sds_url, sds_api_key, spine_org_code)
 
 
-def start_tornado_server(data_dir: pathlib.Path, workflows: Dict[str, workflow.CommonWorkflow]) -> None:
-    """
-    Start Tornado server
+def load_configuration_manager(data_dir: pathlib.Path) -> configuration_manager.ConfigurationManager:
+    """Parse the interactions configuration file ahead of the server being started.
+
     :param data_dir: The directory to load interactions configuration from.
-    :param workflows: The workflows to be used to handle messages.
+    :return: The config manager used to obtain interaction details.
     """
     interactions_config_file = str(data_dir / "interactions" / "interactions.json")
-    config_manager = configuration_manager.ConfigurationManager(interactions_config_file)
+    return configuration_manager.ConfigurationManager(interactions_config_file)
+
 
+def start_tornado_server(config_manager: configuration_manager.ConfigurationManager,
+                         workflows: Dict[str, workflow.CommonWorkflow]) -> None:
+    """
+    Start Tornado server
+    :param config_manager: The config manager used to obtain interaction details.
+    :param workflows: The workflows to be used to handle messages.
+    """
     # Note that the paths in generate_openapi.py should be updated if these
     # paths are changed
     supplier_application = tornado.web.Application(
@@ -146,7 +169,10 @@ def main():
     secrets.setup_secret_config("MHS")
     log.configure_logging("outbound")
 
+    configure_event_loop()
+
     data_dir = pathlib.Path(definitions.ROOT_DIR) / "data"
+    config_manager = load_configuration_manager(data_dir)
 
     configure_http_client()
 
@@ -164,7 +190,7 @@ def main():
                                                   ca_certs=secrets.get_secret_config('CA_CERTS'))
     max_retries = int(config.get_config('OUTBOUND_TRANSMISSION_MAX_RETRIES', default="3"))
     retry_delay = int(config.get_config('OUTBOUND_TRANSMISSION_RETRY_DELAY', default="100"))
-    validate_cert = str2bool(config.get_config('OUTBOUND_VALIDATE_CERTIFICATE', default=str(True)))
+    validate_cert = config.get_config_bool('OUTBOUND_VALIDATE_CERTIFICATE', default=True)
     http_proxy_host = config.get_config('OUTBOUND_HTTP_PROXY', default=None)
     http_proxy_port = None
     if http_proxy_host is not None:
@@ -189,7 +215,7 @@ def main():
     max_request_size = int(config.get_config('SPINE_REQUEST_MAX_SIZE'))
     workflows = initialise_workflows(transmission, party_key, work_description_store, sync_async_store,
                                      max_request_size, routing)
-    start_tornado_server(data_dir, workflows)
+    start_tornado_server(config_manager, workflows)
 
 
 if __name__ == "__main__":
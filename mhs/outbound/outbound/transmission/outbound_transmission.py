@@ -1,5 +1,7 @@
 """This module defines the outbound transmission component."""
 
+import functools
+import logging
 from ssl import SSLError
 from typing import Dict
 
@@ -17,39 +19,41 @@ class OutboundTransmissionError(Exception):
 
 
 class OutboundTransmission(transmission_adaptor.TransmissionAdaptor):
-    errors_not_to_retry = (
-        httpclient.HTTPClientError,
-        SSLError
-    )
-
     """A component that sends HTTP requests to a remote MHS."""
 
     def __init__(self, client_cert: str, client_key: str, ca_certs: str, max_retries: int,
-                 retry_delay: int, validate_cert: bool, http_proxy_host: str = None, http_proxy_port: int = None):
+                 retry_delay: int, validate_cert: bool, http_proxy_host: str = None, http_proxy_port: int = None,
+                 max_retry_backoff: int = 10000):
         """Create a new OutboundTransmission that loads certificates from the specified directory.
 
         :param client_cert: A string containing the filepath of the client certificate file.
         :param client_key: A string containing the filepath of the client private key file.
         :param ca_certs: A string containing the filepath of the certificate authority certificate file.
         :param max_retries: An integer with the value of the max number times to retry sending the request if it fails.
-        :param retry_delay: An integer representing the delay (in milliseconds) to use between retry attempts.
+        :param retry_delay: An integer representing the base delay (in milliseconds) to use between retry attempts.
         :param http_proxy_host The hostname of the HTTP proxy to be used.
         :param http_proxy_port The port of the HTTP proxy to be used.
+        :param max_retry_backoff The upper bound (in milliseconds) on the backoff delay between retry attempts.
         """
         self._client_cert = client_cert
         self._client_key = client_key
         self._ca_certs = ca_certs
         self._max_retries = max_retries
-        self._retry_delay = retry_delay
+        # RetriableAction works in seconds, so convert from milliseconds once here rather than on every request.
+        self._retry_delay_s = retry_delay / 1000
+        self._max_retry_backoff_s = max_retry_backoff / 1000
         self._validate_cert = validate_cert
 
         self._proxy_host = http_proxy_host
         self._proxy_port = http_proxy_port
 
-    async def make_request(self, url: str, headers: Dict[str, str], message: str,
-                           raise_error_response: bool = True) -> httpclient.HTTPResponse:
+        # These callables never vary between requests, so build them once here rather than on each make_request call.
+        self._success_check = lambda r: r.code != 599
+        self._retriable_exception_check = self._is_exception_retriable
 
-        async def make_http_request():
+    async def _make_http_request(self, url: str, headers: Dict[str, str], message: str,
+                                 raise_error_response: bool) -> httpclient.HTTPResponse:
+        if logger.isEnabledFor(logging.INFO):
             logger.info("About to send message with {headers} to {url} using {proxy_host} & {proxy_port}",
                         fparams={
                             "headers": headers,
@@ -57,12 +61,13 @@ class OutboundTransmission(transmission_adaptor.TransmissionAdaptor):
                             "proxy_host": self._proxy_host,
                             "proxy_port": self._proxy_port
                         })
-            response = await CommonHttps.make_request(url=url, method="POST", headers=headers, body=message,
-                                                      client_cert=self._client_cert, client_key=self._client_key,
-                                                      ca_certs=self._ca_certs, validate_cert=self._validate_cert,
-                                                      http_proxy_host=self._proxy_host,
-                                                      http_proxy_port=self._proxy_port,
-                                                      raise_error_response=raise_error_response)
+        response = await CommonHttps.make_request(url=url, method="POST", headers=headers, body=message,
+                                                  client_cert=self._client_cert, client_key=self._client_key,
+                                                  ca_certs=self._ca_certs, validate_cert=self._validate_cert,
+                                                  http_proxy_host=self._proxy_host,
+                                                  http_proxy_port=self._proxy_port,
+                                                  raise_error_response=raise_error_response)
+        if logger.isEnabledFor(logging.INFO):
             logger.info("Sent message with {headers} to {url} using {proxy_host} & {proxy_port} and "
                         "received status code {code}",
                         fparams={
@@ -72,12 +77,17 @@ class OutboundTransmission(transmission_adaptor.TransmissionAdaptor):
                             "proxy_port": self._proxy_port,
                             "code": response.code
                         })
-            return response
+        return response
+
+    async def make_request(self, url: str, headers: Dict[str, str], message: str,
+                           raise_error_response: bool = True) -> httpclient.HTTPResponse:
+        make_http_request = functools.partial(self._make_http_request, url, headers, message, raise_error_response)
 
         retry_result = await retriable_action.RetriableAction(make_http_request, self._max_retries,
-                                                              self._retry_delay / 1000) \
-            .with_success_check(lambda r: r.code != 599) \
-            .with_retriable_exception_check(self._is_exception_retriable) \
+                                                              self._retry_delay_s) \
+            .with_exponential_backoff(self._max_retry_backoff_s) \
+            .with_success_check(self._success_check) \
+            .with_retriable_exception_check(self._retriable_exception_check) \
             .execute()
 
         if not retry_result.is_successful:
@@ -91,19 +101,14 @@ class OutboundTransmission(transmission_adaptor.TransmissionAdaptor):
 
         return retry_result.result
 
-    def _is_tornado_network_error(self, e: Exception) -> bool:
-        return isinstance(e, httpclient.HTTPClientError) and e.code == 599
-
     def _is_exception_retriable(self, e: Exception) -> bool:
-        retriable = True
-
-        if isinstance(e, self.errors_not_to_retry):
-            retriable = False
-
-        # While we normally don't want to retry on an HTTP error, there is a special case where the Tornado
+        # We normally don't want to retry on an HTTP error, but there is a special case where the Tornado
         # HTTPClientError's code is set to 599, which actually represents a connection error, rather than an HTTP error
         # response.
-        if self._is_tornado_network_error(e):
-            retriable = True
+        if isinstance(e, httpclient.HTTPClientError):
+            return e.code == 599
+
+        if isinstance(e, SSLError):
+            return False
 
-        return retriable
+        return True
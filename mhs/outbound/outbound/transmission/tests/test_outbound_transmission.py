@@ -1,7 +1,7 @@
 import ssl
 from pathlib import Path
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import patch, sentinel, call
+from unittest.mock import ANY, patch, sentinel
 
 import definitions
 from tornado import httpclient
@@ -66,7 +66,8 @@ class TestOutboundTransmission(IsolatedAsyncioTestCase):
                                           ca_certs=CA_CERTS_PATH,
                                           validate_cert=VALIDATE_CERT,
                                           proxy_host=None,
-                                          proxy_port=None
+                                          proxy_port=None,
+                                          prepare_curl_callback=ANY
                                           )
 
             self.assertIs(actual_response, sentinel.result, "Expected content should be returned.")
@@ -92,7 +93,8 @@ class TestOutboundTransmission(IsolatedAsyncioTestCase):
                                           ca_certs=CA_CERTS_PATH,
                                           validate_cert=VALIDATE_CERT,
                                           proxy_host=HTTP_PROXY_HOST,
-                                          proxy_port=HTTP_PROXY_PORT)
+                                          proxy_port=HTTP_PROXY_PORT,
+                                          prepare_curl_callback=ANY)
 
             self.assertIs(actual_response, sentinel.result, "Expected content should be returned.")
 
@@ -151,5 +153,9 @@ class TestOutboundTransmission(IsolatedAsyncioTestCase):
                 await self.transmission.make_request(URL_VALUE, HEADERS, MESSAGE)
 
             self.assertEqual(mock_fetch.call_count, EXPECTED_MAX_HTTP_REQUESTS)
-            expected_sleep_arguments = [call(RETRY_DELAY_IN_SECONDS) for _ in range(MAX_RETRIES)]
-            self.assertEqual(expected_sleep_arguments, mock_sleep.call_args_list)
+            self.assertEqual(MAX_RETRIES, mock_sleep.call_count)
+            for attempt, sleep_call in enumerate(mock_sleep.call_args_list, start=1):
+                delay_used = sleep_call[0][0]
+                self.assertGreaterEqual(delay_used, 0, "Backoff delay should never be negative.")
+                self.assertLessEqual(delay_used, RETRY_DELAY_IN_SECONDS * (2 ** (attempt - 1)),
+                                     "Backoff delay should be bounded by the exponential schedule.")
@@ -6,7 +6,6 @@ from lookup import sds_mock_connection_factory
 from utilities import certs, config, integration_adaptors_logger as log, secrets
 
 import definitions
-from utilities.string_utilities import str2bool
 
 _LDAP_CONNECTION_RETRIES = int(config.get_config('LDAP_CONNECTION_RETRIES', default='3'))
 _LDAP_CONNECTION_TIMEOUT_IN_SECONDS = int(config.get_config('LDAP_CONNECTION_TIMEOUT_IN_SECONDS', default='5'))
@@ -48,7 +47,7 @@ def build_sds_connection_tls(ldap_address: str, private_key: str, local_cert: st
 
 
 def _configure_ldap_connection(server) -> ldap3.Connection:
-    lazy_ldap = str2bool(config.get_config("LAZY_LDAP", default=str(True)))
+    lazy_ldap = config.get_config_bool("LAZY_LDAP", default=True)
     if lazy_ldap:
         connection = ldap3.Connection(server,
                                       lazy=True,